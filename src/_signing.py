@@ -0,0 +1,61 @@
+'''
+Creates query strings and signatures for Codeforces API requests.
+Every signed request passes through these functions, so they are kept
+in a separate fully annotated module, that can be compiled by mypyc:
+    mypyc _signing.py
+If the compiled module is not built, this file is imported as is.
+'''
+
+from os import urandom
+from hashlib import sha512
+from base64 import b32encode
+from operator import itemgetter
+from typing import Dict, List, Sequence, Tuple
+
+
+def to_http(param: str, value: object) -> str:
+    '''
+    Convert param into HTTP format: param=value.
+    '''
+    if not isinstance(value, list):
+        return f'{param}={value}'
+    return f'{param}={";".join([str(item) for item in value])}'
+
+
+def sorted_params(params: Dict[str, object],
+                  fixed: Sequence[Tuple[str, str]] = ()) -> List[str]:
+    '''
+    Returns list of params and values, sorted lexicographically.
+    Params are sorted by name only, so long values are never
+    compared. fixed is a list of already converted params as
+    (param, 'param=value') pairs.
+    '''
+    lst: List[Tuple[str, str]] = [(param, to_http(param, value))
+                                  for param, value in params.items()
+                                  if value is not None]
+    lst.extend(fixed)
+    lst.sort(key=itemgetter(0))
+    return [pair for param, pair in lst]
+
+
+def get_url(params: Dict[str, object],
+            fixed: Sequence[Tuple[str, str]] = ()) -> str:
+    '''
+    Create url by sorted lexicographically params:
+    param_1=value_1&param_2=value_2...param_n=value_n.
+    '''
+    return '&'.join(sorted_params(params, fixed))
+
+
+def sign_url(method: str, url: str, sig_suffix: bytes) -> str:
+    '''
+    Returns url with apiSig param added. sig_suffix is '#<secret>'
+    encoded in UTF-8.
+    '''
+    rand: str = b32encode(urandom(4))[:6].lower().decode('ascii')
+    payload: bytes = b''.join([rand.encode('utf-8'), b'/',
+                               method.encode('utf-8'), b'?',
+                               url.encode('utf-8'),
+                               sig_suffix])
+    # Order of params in url doesn't matter, so apiSig is appended.
+    return url + '&apiSig=' + rand + sha512(payload).hexdigest()
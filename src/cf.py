@@ -1,6 +1,5 @@
 from pathlib import Path
 from json import load, dump
-from tabulate import tabulate
 from argparse import ArgumentParser
 from cfapi import ext_CodeforcesAPI
 
@@ -7,32 +7,97 @@ send code, get standings in console and so on.
 __version__ = '0.0.3a'
 
 from os import makedirs
-from time import time
+from time import time, localtime, strftime, monotonic, sleep
+from sys import intern
 from pathlib import Path
-from hashlib import sha512
-from tabulate import tabulate
-from datetime import datetime
-from random import SystemRandom
-from robobrowser import RoboBrowser
-from webbrowser import open_new_tab
-from os.path import join as join_path
-from requests import get as http_request
-from string import ascii_lowercase, digits
+from os.path import join as join_path, getmtime
+from requests import Session
+from threading import Lock
+from functools import lru_cache, cached_property
+from concurrent.futures import ThreadPoolExecutor
+from _signing import to_http, get_url, sign_url
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_VALID_LANGS = frozenset(('en', 'ru'))
+_PROBLEM_SYMBOLS = tuple(chr(ord('A') + i) for i in range(26))
+_TIME_FORMAT = '%d.%m.%Y %H:%M'
+_VERDICT_COLS_EN = ('#', 'When', 'Who', 'Problem',
+                    'Lang', 'Verdict', 'Time', 'Memory')
+_VERDICT_COLS_RU = ('#', 'Когда', 'Кто', 'Задача',
+                    'Язык', 'Вердикт', 'Время', 'Память')
+_VERDICT_ALIGN = ('right', 'left', 'left', 'left',
+                  'left', 'left', 'right', 'right')
 
 
 class CodeforcesResponse:
     '''
     Basic class for all Codeforces API responses.
+    Documented fields are stored in __slots__, so vars(obj) shows only
+    the rest of them. Use to_dict to get all fields.
     '''
 
+    # Fields, which are not listed in __slots__ of a subclass,
+    # are stored in __dict__.
+    __slots__ = ('__dict__',)
+
+    # Fields, which contain another response object or a list of them,
+    # mapped to the class of that object.
+    _nested = {}
+    _nested_lists = {}
+    # Fields with few distinct string values, which repeat in many
+    # objects. Equal values share one interned str object.
+    _intern_fields = frozenset()
+
     def __init__(self, json: dict):
         '''
         Initializes user object by gived json. Json must be a dict
         object.
         '''
+        nested, nested_lists = self._nested, self._nested_lists
+        intern_fields = self._intern_fields
         for name, value in json.items():
+            if name in nested:
+                value = nested[name](value)
+            elif name in nested_lists:
+                value = nested_lists[name].from_list(value)
+            elif name in intern_fields and isinstance(value, str):
+                value = intern(value)
             setattr(self, name, value)
 
+    @classmethod
+    def from_list(cls, jsons: list):
+        '''
+        Returns list of objects, initialized by each json from jsons.
+        '''
+        return [cls(json) for json in jsons]
+
+    def to_dict(self):
+        '''
+        Returns dict with all fields of the object, nested objects are
+        converted to dicts too. Absent fields are not included.
+        '''
+        result = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name != '__dict__' and hasattr(self, name):
+                    result[name] = getattr(self, name)
+        result.update(self.__dict__)
+        for name, value in result.items():
+            if isinstance(value, CodeforcesResponse):
+                result[name] = value.to_dict()
+            elif isinstance(value, list):
+                result[name] = [item.to_dict()
+                                if isinstance(item, CodeforcesResponse)
+                                else item for item in value]
+        return result
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, self.to_dict())
+
 
 class User(CodeforcesResponse):
     '''
@@ -65,6 +130,13 @@ class User(CodeforcesResponse):
     titlePhoto              : str. User's title photo URL.
     '''
 
+    __slots__ = ('handle', 'email', 'vkId', 'openId', 'firstName', 'lastName',
+                 'country', 'city', 'organization', 'contribution', 'rank',
+                 'rating', 'maxRank', 'maxRating', 'lastOnlineTimeSeconds',
+                 'registrationTimeSeconds', 'friendOfCount', 'avatar',
+                 'titlePhoto')
+    _intern_fields = frozenset(('rank', 'maxRank'))
+
 class BlogEntry(CodeforcesResponse):
     '''
     Represents a Codeforces blog entry. May be in either short or full
@@ -86,6 +158,11 @@ class BlogEntry(CodeforcesResponse):
     rating                  : int.
     '''
 
+    __slots__ = ('id', 'originalLocale', 'creationTimeSeconds', 'authorHandle',
+                 'title', 'content', 'locale', 'modificationTimeSeconds',
+                 'allowViewHistory', 'tags', 'rating')
+    _intern_fields = frozenset(('originalLocale', 'locale'))
+
 
 class Comment(CodeforcesResponse):
     '''
@@ -100,6 +177,10 @@ class Comment(CodeforcesResponse):
     rating              : int.
     '''
 
+    __slots__ = ('id', 'creationTimeSeconds', 'commentatorHandle', 'locale',
+                 'text', 'parentCommentId', 'rating')
+    _intern_fields = frozenset(('locale',))
+
 
 class RecentAction(CodeforcesResponse):
     '''
@@ -109,12 +190,8 @@ class RecentAction(CodeforcesResponse):
     comment     : Comment. Can be absent.
     '''
 
-    def __init__(self, json: dict):
-        super().__init__(json)
-        if hasattr(self, 'blogEntry'):
-            self.blogEntry = BlogEntry(self.blogEntry)
-        if hasattr(self, 'comment'):
-            self.comment = Comment(self.comment)
+    __slots__ = ('timeSeconds', 'blogEntry', 'comment')
+    _nested = {'blogEntry': BlogEntry, 'comment': Comment}
 
 
 class RatingChange(CodeforcesResponse):
@@ -136,6 +213,9 @@ class RatingChange(CodeforcesResponse):
     newRating               : int. User rating after the contest.
     '''
 
+    __slots__ = ('contestId', 'contestName', 'handle', 'rank',
+                 'ratingUpdateTimeSeconds', 'oldRating', 'newRating')
+
 
 class Contest(CodeforcesResponse):
     '''
@@ -179,6 +259,12 @@ class Contest(CodeforcesResponse):
     season              : str.  Can be absent.
     '''
 
+    __slots__ = ('id', 'name', 'type', 'phase', 'frozen', 'durationSeconds',
+                 'startTimeSeconds', 'relativeTimeSeconds', 'preparedBy',
+                 'websiteUrl', 'description', 'difficulty', 'kind',
+                 'icpcRegion', 'country', 'city', 'season')
+    _intern_fields = frozenset(('type', 'phase', 'kind'))
+
 
 class Member(CodeforcesResponse):
     '''
@@ -186,6 +272,8 @@ class Member(CodeforcesResponse):
     handle : str. Codeforces user handle.
     '''
 
+    __slots__ = ('handle',)
+
 
 class Party(CodeforcesResponse):
     '''
@@ -212,9 +300,10 @@ class Party(CodeforcesResponse):
                                 a contest.
     '''
 
-    def __init__(self, json: dict):
-        super().__init__(json)
-        self.members = list(map(Member, self.members))
+    __slots__ = ('contestId', 'members', 'participantType', 'teamId',
+                 'teamName', 'ghost', 'room', 'startTimeSeconds')
+    _nested_lists = {'members': Member}
+    _intern_fields = frozenset(('participantType',))
 
 
 class Problem(CodeforcesResponse):
@@ -235,6 +324,10 @@ class Problem(CodeforcesResponse):
     tags            : list of str objects. Problem tags.
     '''
 
+    __slots__ = ('contestId', 'problemsetName', 'index', 'name', 'type',
+                 'points', 'rating', 'tags')
+    _intern_fields = frozenset(('type',))
+
 
 class ProblemStatistics(CodeforcesResponse):
     '''
@@ -246,6 +339,8 @@ class ProblemStatistics(CodeforcesResponse):
     solvedCount : int. Number of users, who solved the problem.
     '''
 
+    __slots__ = ('contestId', 'index', 'solvedCount')
+
 
 class Submission(CodeforcesResponse):
     '''
@@ -279,10 +374,13 @@ class Submission(CodeforcesResponse):
                                 solution for one test.
     '''
 
-    def __init__(self, json: dict):
-        super().__init__(json)
-        self.problem = Problem(self.problem)
-        self.author = Party(self.author)
+    __slots__ = ('id', 'contestId', 'creationTimeSeconds',
+                 'relativeTimeSeconds', 'problem', 'author',
+                 'programmingLanguage', 'verdict', 'testset',
+                 'passedTestCount', 'timeConsumedMillis',
+                 'memoryConsumedBytes')
+    _nested = {'problem': Problem, 'author': Party}
+    _intern_fields = frozenset(('programmingLanguage', 'verdict', 'testset'))
 
 
 class Hack(CodeforcesResponse):
@@ -307,10 +405,10 @@ class Hack(CodeforcesResponse):
                           Localized. Can be absent.
     '''
 
-    def __init__(self, json: dict):
-        super().__init__(json)
-        self.hacker = Party(self.hacker)
-        self.defender = Party(self.defender)
+    __slots__ = ('id', 'creationTimeSeconds', 'hacker', 'defender', 'verdict',
+                 'problem', 'test', 'judgeProtocol')
+    _nested = {'hacker': Party, 'defender': Party, 'problem': Problem}
+    _intern_fields = frozenset(('verdict',))
 
 
 class ProblemResult(CodeforcesResponse):
@@ -333,6 +431,10 @@ class ProblemResult(CodeforcesResponse):
                                         for this problem.
     '''
 
+    __slots__ = ('points', 'penalty', 'rejectedAttemptCount', 'type',
+                 'bestSubmissionTimeSeconds')
+    _intern_fields = frozenset(('type',))
+
 
 class RanklistRow(CodeforcesResponse):
     '''
@@ -358,11 +460,11 @@ class RanklistRow(CodeforcesResponse):
                                          total score of the party.
     '''
 
-    def __init__(self, json: dict):
-        super().__init__(json)
-        self.party = Party(self.party)
-        self.problemResults = list(map(ProblemResult,
-                                       self.problemResults))
+    __slots__ = ('party', 'rank', 'points', 'penalty', 'successfulHackCount',
+                 'unsuccessfulHackCount', 'problemResults',
+                 'lastSubmissionTimeSeconds')
+    _nested = {'party': Party}
+    _nested_lists = {'problemResults': ProblemResult}
 
 
 class CodeforcesAPI:
@@ -372,8 +474,16 @@ class CodeforcesAPI:
     if you don't need anything unusual to do with it.
     '''
 
-    _site_link = 'http://codeforces.com/'
-    _api_link = 'http://codeforces.com/api/'
+    _site_link = 'https://codeforces.com/'
+    _api_link = 'https://codeforces.com/api/'
+    _timeout = 30
+    _reference_ttl = 600
+    _cache_size = 32
+    # Codeforces allows one API call per two seconds. Simultaneous
+    # page requests are spaced by this interval and retried, if the
+    # limit is exceeded anyway.
+    _call_interval = 2
+    _call_retries = 3
 
     def __init__(self,
                  key: str = None,
@@ -384,7 +494,13 @@ class CodeforcesAPI:
         key      : str. User API key from https://codeforces.com/settings/api
         secret   : str. User API secret from https://codeforces.com/settings/api
         lang : str. Local language for requests. Can be \"en\" or \"ru\"
+        All requests are sent through one HTTP session, so the
+        connection to Codeforces is kept alive between them.
         '''
+        self._session = Session()
+        self._call_lock = Lock()
+        self._last_call = 0.0
+        self._cache = dict()
         self.key = key
         self.secret = secret
         self.lang = lang
@@ -396,6 +512,10 @@ class CodeforcesAPI:
     @key.setter
     def key(self, value):
         self._key = value
+        if value is None:
+            self._key_param = None
+        else:
+            self._key_param = ('apiKey', to_http('apiKey', value))
 
     @property
     def secret(self):
@@ -404,6 +524,10 @@ class CodeforcesAPI:
     @secret.setter
     def secret(self, value):
         self._secret = value
+        if value is None:
+            self._sig_suffix = None
+        else:
+            self._sig_suffix = ('#' + value).encode('utf-8')
 
     @property
     def lang(self):
@@ -411,64 +535,94 @@ class CodeforcesAPI:
 
     @lang.setter
     def lang(self, value: str):
-        if value == 'ru' or value == 'en':
+        if value in _VALID_LANGS:
             self._lang = value
+            self._lang_param = ('lang', to_http('lang', value))
         else:
-            raise TypeError('Language can be only \"en\" \
+            raise ValueError('Language can be only \"en\" \
                              or \"ru\", not {}'.format(value))
 
-    def _to_http(self, param, value):
-        '''
-        Convert param into HTTP format: param=value.
-        '''
-        if isinstance(value, list):
-            value = ';'.join(map(str, value))
-        else:
-            value = str(value)
-        return '{}={}'.format(param, value)
-
-    def _sorted_str_kwargs(self, **kwargs):
-        '''
-        Returns list of params and values, sorted lexicographically.
-        '''
-        lst = list()
-        for param, value in kwargs.items():
-            if value is not None:
-                lst.append(self._to_http(param, value))
-        return sorted(lst)
-
-    def _get_url(self, **kwargs):
-        '''
-        Create url by sorted lexicographically kwargs:
-        param_1=value_1&param_2=value_2...param_n=value_n.
-        '''
-        return '&'.join(self._sorted_str_kwargs(**kwargs))
-
-    def _url_api_request(self, method: str, **kwargs):
+    def _url_api_request(self, method: str, params: dict):
         '''
         Creates url for API request. Uses key and secret from
         https://codeforces.com/settings/api if provided.
+        Adds time param to params dict for signed requests. Lang and
+        key params are converted once, when they are set.
         '''
-        kwargs['lang'] = self.lang
-        if self._key is not None and self._secret is not None:
-            kwargs['time'] = int(time())
-            kwargs['apiKey'] = self._key
-            rand = ''.join(SystemRandom().choice(ascii_lowercase +
-                                                 digits) for i in range(6))
-            sig = rand + sha512((rand + '/' + method + '?' +
-                                 self._get_url(**kwargs) + '#' +
-                                 self._secret).encode('utf-8')).hexdigest()
-            kwargs['apiSig'] = sig
-        return self._get_url(**kwargs)
+        if self._key is None or self._secret is None:
+            return get_url(params, [self._lang_param])
+        params['time'] = int(time())
+        return sign_url(method,
+                        get_url(params, [self._key_param, self._lang_param]),
+                        self._sig_suffix)
 
     def _check_request(self, request):
         if not request.ok:
             raise ConnectionError('Request status \
-                                  is {}'.format(self.last_api.status_code))
+                                  is {}'.format(request.status_code))
+
+    def _check_api_response(self, response):
+        if not response.ok:
+            # Codeforces describes failed API calls in JSON comment.
+            try:
+                comment = _json_loads(response.content)['comment']
+            except (ValueError, KeyError, TypeError):
+                self._check_request(response)
+            raise ConnectionError('Codeforces API error: {}'.format(comment))
+
+    def _request_api_raw(self, method: str, params: dict):
+        '''
+        Requests https://codeforces.com/api/<method_name> with params
+        dict and returns json object with info from site. The dict is
+        used as is, without copying. Unlike request_api, doesn't
+        change last_api, so it can be called from several threads.
+        '''
+        response = self._session.get(
+            self._api_link +
+            method + '?' +
+            self._url_api_request(method, params),
+            timeout=self._timeout
+        )
+        self._check_api_response(response)
+        json =_json_loads(response.content)
+        if json['status'] != 'OK':
+            raise ConnectionError('Codeforces API error: \
+                                  {}', json['comment'])
+        return json
+
+    def _cached(self, key: tuple, request):
+        '''
+        Returns result of request(), saved by key, if it was saved less
+        than _reference_ttl seconds ago. Otherwise, calls request() and
+        saves its result. Expired results are dropped, and not more
+        than _cache_size results are kept: the oldest one is dropped
+        first.
+        '''
+        now = time()
+        if key in self._cache:
+            saved, result = self._cache[key]
+            if now - saved < self._reference_ttl:
+                return result
+        result = request()
+        for old in [old for old, (saved, _) in self._cache.items()
+                    if now - saved >= self._reference_ttl]:
+            del self._cache[old]
+        self._cache.pop(key, None)
+        if len(self._cache) >= self._cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now, result)
+        return result
+
+    def clear_cache(self):
+        '''
+        Forgets saved results of contest_list and problemset_problems,
+        so the next calls will request Codeforces again.
+        '''
+        self._cache.clear()
 
     def request_api(self, method: str, **kwargs):
         '''
-        Requests http://codeforces.com/api/<method_name> and returns
+        Requests https://codeforces.com/api/<method_name> and returns
         json object with info from site. Type of method must be a
         string.
         Uses key and secret if provided. Make sure you have set
@@ -477,18 +631,15 @@ class CodeforcesAPI:
         Raises ConnectionError if request is not OK.
         Cryptographically secure.
         Creates last_api dict. Contains JSON with last API request result.
+        As from is a keyword in Python, API param from can be passed
+        as from_.
         Example: cf.request_api('user.info', handles=['tourist', 'Petr'])
+                 cf.request_api('user.status', handle='tourist', from_=1)
         '''
-        self.last_api = http_request(
-            self._api_link +
-            method + '?' +
-            self._url_api_request(method, **kwargs)
-        )
-        self._check_request(self.last_api)
-        self.last_api = self.last_api.json()
-        if self.last_api['status'] != 'OK':
-            raise ConnectionError('Codeforces API error: \
-                                  {}', self.last_api['comment'])
+        from_ = kwargs.pop('from_', None)
+        if from_ is not None:
+            kwargs['from'] = from_
+        self.last_api = self._request_api_raw(method, kwargs)
         return self.last_api
 
     def blogEntry_comments(self, blogEntryId: int):
@@ -501,7 +652,7 @@ class CodeforcesAPI:
         '''
         self.request_api('blogEntry.comments',
                          blogEntryId=blogEntryId)
-        return list(map(Comment, self.last_api['result']))
+        return Comment.from_list(self.last_api['result'])
 
     def blogEntry_view(self, blogEntryId: int):
         '''
@@ -530,7 +681,7 @@ class CodeforcesAPI:
         '''
         self.request_api('contest.hacks',
                          contestId=contestId)
-        return list(map(Hack, self.last_api['result']))
+        return Hack.from_list(self.last_api['result'])
 
     def contest_list(self, gym: bool = False):
         '''
@@ -541,11 +692,18 @@ class CodeforcesAPI:
         too, including mashups and private gyms.
         gym : bool. If true - than gym contests are returned. Otherwide,
                     regular contests are returned.
+        Result is saved for 10 minutes, use clear_cache to forget it.
+        Each call returns a new list. If saved result is returned,
+        last_api is not updated and contains the previous request.
         Example: cf.contest_list(gym=True)
         '''
-        self.request_api('contest.list',
-                         gym=gym)
-        return list(map(Contest, self.last_api['result']))
+        def request():
+            self.request_api('contest.list',
+                             gym=gym)
+            return Contest.from_list(self.last_api['result'])
+
+        return list(self._cached(('contest.list', self._key, self.lang, gym),
+                                 request))
 
     def contest_ratingChanges(self, contestId: int):
         '''
@@ -559,11 +717,11 @@ class CodeforcesAPI:
         '''
         self.request_api('contest.ratingChanges',
                          contestId=contestId)
-        return list(map(RatingChange, self.last_api['result']))
+        return RatingChange.from_list(self.last_api['result'])
 
     def contest_standings(self, contestId: int, from_row: int = None,
                           count: int = None, handles: str = None, room: int = None,
-                          showUnofficial: bool = None):
+                          showUnofficial: bool = None, raw: bool = False):
         '''
         Codeforces API name: contest.standings.
         Returns the description of the contest and the
@@ -589,6 +747,10 @@ class CodeforcesAPI:
                                      out of competition) are shown.
                                      Otherwise, only official contestants
                                      are shown.
+        raw                  : bool. If true than result dict from JSON is
+                                     returned as is, without creating
+                                     objects. It's much faster for big
+                                     standings.
         Example: cf.contest_standings(contestId=566,
                                       from_row=1,
                                       count=5,
@@ -600,7 +762,7 @@ class CodeforcesAPI:
         if handles is not None and len(handles) > 10000:
             raise TypeError('handles len is {}. \
                             Maximum: 10000'.format(len(handles)))
-        kwargs = {
+        params = {
             'contestId': contestId,
             'from': from_row,
             'count': count,
@@ -608,13 +770,150 @@ class CodeforcesAPI:
             'room': room,
             'showUnofficial': showUnofficial
         }
-        self.request_api('contest.standings', **kwargs)
-        return [Contest(self.last_api['result']['contest']),
-                list(map(Problem, self.last_api['result']['problems'])),
-                list(map(RanklistRow, self.last_api['result']['rows']))]
+        self.last_api = self._request_api_raw('contest.standings', params)
+        result = self.last_api['result']
+        if raw:
+            return result
+        return [Contest(result['contest']),
+                Problem.from_list(result['problems']),
+                RanklistRow.from_list(result['rows'])]
+
+    def contest_standings_paged(self, contestId: int, count: int,
+                                from_row: int = 1, page_size: int = 500,
+                                workers: int = 4, handles: str = None,
+                                room: int = None,
+                                showUnofficial: bool = None):
+        '''
+        Same as contest_standings, but requests count rows as several
+        pages of page_size rows. Pages are requested simultaneously
+        by workers threads and joined in order.
+        Codeforces allows one API call per two seconds, so requests
+        are started not more often than that. Pages, which fail with
+        \"Call limit exceeded\" error, are requested again.
+        Doesn't change last_api.
+        count (Required) : int. Number of standing rows to return.
+        page_size        : int. Number of rows in one request.
+        workers          : int. Number of simultaneous requests.
+        Other arguments are the same as in contest_standings.
+        Example: cf.contest_standings_paged(contestId=566,
+                                            count=2000,
+                                            page_size=500)
+        '''
+        if count <= 0:
+            raise ValueError('count is {}. \
+                             Must be positive'.format(count))
+        if page_size <= 0:
+            raise ValueError('page_size is {}. \
+                             Must be positive'.format(page_size))
+        if isinstance(handles, str):
+            handles = [handles]
+        if handles is not None and len(handles) > 10000:
+            raise ValueError('handles len is {}. \
+                             Maximum: 10000'.format(len(handles)))
+        pages = [(start, min(page_size, from_row + count - start))
+                 for start in range(from_row, from_row + count, page_size)]
+        results = self._request_standings_pages(contestId, pages, workers,
+                                                handles, room,
+                                                showUnofficial)
+        return [Contest(results[0]['contest']),
+                Problem.from_list(results[0]['problems']),
+                RanklistRow.from_list([json for result in results
+                                       for json in result['rows']])]
+
+    def _wait_call_slot(self):
+        '''
+        Waits until _call_interval seconds have passed since the
+        previous call of this method. Can be called from several
+        threads, calls are spaced one after another.
+        '''
+        with self._call_lock:
+            delay = self._last_call + self._call_interval - monotonic()
+            if delay > 0:
+                sleep(delay)
+            self._last_call = monotonic()
+
+    def _request_standings_pages(self, contestId: int, pages: list,
+                                 workers: int, handles: list = None,
+                                 room: int = None,
+                                 showUnofficial: bool = None):
+        '''
+        Requests contest standings pages, given as list of
+        (from_row, count) pairs. Pages are requested simultaneously
+        by workers threads, but not more often than once per
+        _call_interval seconds. Pages, which fail with call limit
+        error, are retried up to _call_retries times. Returns list
+        of results of the requests in the same order.
+        '''
+        def request_page(page: tuple):
+            for attempt in range(self._call_retries + 1):
+                # NOTE: from is a keyword in Python.
+                params = {
+                    'contestId': contestId,
+                    'from': page[0],
+                    'count': page[1],
+                    'handles': handles,
+                    'room': room,
+                    'showUnofficial': showUnofficial
+                }
+                self._wait_call_slot()
+                try:
+                    return self._request_api_raw('contest.standings',
+                                                 params)['result']
+                except ConnectionError as error:
+                    if (attempt == self._call_retries or
+                            'Call limit exceeded' not in str(error)):
+                        raise
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(request_page, pages))
+
+    def contest_standings_iter(self, contestId: int, from_row: int = None,
+                               count: int = None, handles: str = None,
+                               room: int = None,
+                               showUnofficial: bool = None):
+        '''
+        Codeforces API name: contest.standings.
+        Same as contest_standings, but yields RanklistRow objects one by
+        one, while the response is being downloaded. Only one row is
+        kept in memory at a time, so it's useful for big standings.
+        Contest and problems are not returned, use contest_standings
+        with count=1 to get them. Requires ijson. Doesn't change
+        last_api.
+        Arguments are the same as in contest_standings.
+        Example: for row in cf.contest_standings_iter(contestId=566):
+                     print(row.rank)
+        '''
+        from ijson import items
+        if isinstance(handles, str):
+            handles = [handles]
+        if handles is not None and len(handles) > 10000:
+            raise ValueError('handles len is {}. \
+                             Maximum: 10000'.format(len(handles)))
+        # NOTE: from is a keyword in Python.
+        params = {
+            'contestId': contestId,
+            'from': from_row,
+            'count': count,
+            'handles': handles,
+            'room': room,
+            'showUnofficial': showUnofficial
+        }
+        with self._session.get(
+            self._api_link +
+            'contest.standings?' +
+            self._url_api_request('contest.standings', params),
+            timeout=self._timeout,
+            stream=True
+        ) as response:
+            self._check_api_response(response)
+            response.raw.decode_content = True
+            for json in items(response.raw, 'result.rows.item',
+                              use_float=True):
+                yield RanklistRow(json)
 
     def contest_status(self, contestId: int, handle: str = None,
-                       from_sub: int = None, count: int = None):
+                       from_sub: int = None, count: int = None,
+                       raw: bool = False):
         '''
         Codeforces API name: contest.status
         Returns submissions as list of Submission for specified contest.
@@ -627,17 +926,23 @@ class CodeforcesAPI:
         from_sub (API: from) : int. 1-based index of the first submission
                                     to return.
         count                : int. Number of returned submissions.
+        raw                  : bool. If true than list of submission dicts
+                                     from JSON is returned as is, without
+                                     creating objects. It's much faster for
+                                     many submissions.
         Example: cf.contest_status(contestId=566, from_sub=1, count=10)
         '''
         # NOTE: from is a keyword in Python.
-        kwargs = {
+        params = {
             'contestId': contestId,
             'handle': handle,
             'from': from_sub,
             'count': count
         }
-        self.request_api('contest.status', **kwargs)
-        return list(map(Submission, self.last_api['result']))
+        self.last_api = self._request_api_raw('contest.status', params)
+        if raw:
+            return self.last_api['result']
+        return Submission.from_list(self.last_api['result'])
 
     def problemset_problems(self, tags: list = None, problemsetName: str = None):
         '''
@@ -648,16 +953,25 @@ class CodeforcesAPI:
         Problems can be filtered by tags.
         tags           : list of str. Semicilon-separated list of tags.
         problemsetName : str. Custom problemset's short name, like 'acmsguru'
+        Result is saved for 10 minutes, use clear_cache to forget it.
+        Each call returns new lists. If saved result is returned,
+        last_api is not updated and contains the previous request.
         Example: cf.problemset_problems(tags=['implementation'])
         '''
-
-        self.request_api('problemset.problems',
-                         tags=tags,
-                         problemsetName=problemsetName)
-        return [list(map(Problem,
-                         self.last_api['result']['problems'])),
-                list(map(ProblemStatistics,
-                         self.last_api['result']['problemStatistics']))]
+        def request():
+            self.request_api('problemset.problems',
+                             tags=tags,
+                             problemsetName=problemsetName)
+            result = self.last_api['result']
+            return [Problem.from_list(result['problems']),
+                    ProblemStatistics.from_list(result['problemStatistics'])]
+
+        problems, statistics = self._cached(
+            ('problemset.problems', self._key, self.lang,
+             tuple(tags or ()), problemsetName),
+            request
+        )
+        return [list(problems), list(statistics)]
 
     def problemset_recentStatus(self, count: int, problemsetName: str = None):
         '''
@@ -674,7 +988,7 @@ class CodeforcesAPI:
         self.request_api('problemset.recentStatus',
                          count=count,
                          problemsetName=problemsetName)
-        return list(map(Submission, self.last_api['result']))
+        return Submission.from_list(self.last_api['result'])
 
     def recentActions(self, maxCount: int):
         '''
@@ -687,7 +1001,7 @@ class CodeforcesAPI:
         if maxCount > 100:
             raise TypeError('maxCount is {}. Maximum: 100'.format(maxCount))
         self.request_api('recentActions', maxCount=maxCount)
-        return list(map(RecentAction, self.last_api['result']))
+        return RecentAction.from_list(self.last_api['result'])
 
     def user_blogEntries(self, handle: str):
         '''
@@ -698,7 +1012,7 @@ class CodeforcesAPI:
         Example: cf.user_blogEntries(handle='Fefer_Ivan')
         '''
         self.request_api('user.blogEntries', handle=handle)
-        return list(map(BlogEntry, self.last_api['result']))
+        return BlogEntry.from_list(self.last_api['result'])
 
     def user_friends(self, onlyOnline: bool = False):
         '''
@@ -731,11 +1045,12 @@ class CodeforcesAPI:
             raise TypeError('handles len is {}. \
                              Maximum: 10000'.format(len(handles)))
         self.request_api('user.info',
-                         handles=handles)
-        if len(self.last_api['result']) == 1:
-            return User(self.last_api['result'][0])
+                         handles=';'.join(map(str, handles)))
+        result = self.last_api['result']
+        if len(result) == 1:
+            return User(result[0])
         else:
-            return list(map(User, self.last_api['result']))
+            return User.from_list(result)
 
     def user_ratedList(self, active_only: bool = False):
         '''
@@ -752,7 +1067,7 @@ class CodeforcesAPI:
         Example: cf.user_ratedList(active_only=True)
         '''
         self.request_api('user.ratedList', activeOnly=active_only)
-        return list(map(User, self.last_api['result']))
+        return User.from_list(self.last_api['result'])
 
     def user_rating(self, handle: str):
         '''
@@ -764,7 +1079,7 @@ class CodeforcesAPI:
         '''
         self.request_api('user.rating',
                          handle=handle)
-        return list(map(RatingChange, self.last_api['result']))
+        return RatingChange.from_list(self.last_api['result'])
 
     def user_status(self, handle: str, from_sub: int = None, count: int = None):
         '''
@@ -779,14 +1094,9 @@ class CodeforcesAPI:
                                 from_sub=1,
                                 count=10)
         '''
-        # NOTE: from is a keyword in Python
-        kwargs = {
-            'handle': handle,
-            'from': from_sub,
-            'count': count
-        }
-        self.request_api('user.status', **kwargs)
-        return list(map(Submission, self.last_api['result']))
+        self.request_api('user.status', handle=handle,
+                         from_=from_sub, count=count)
+        return Submission.from_list(self.last_api['result'])
 
 
 class ext_CodeforcesAPI(CodeforcesAPI):
@@ -805,41 +1115,48 @@ class ext_CodeforcesAPI(CodeforcesAPI):
     def __init__(self,
                  handle: str = None,
                  workingDir: str = None,
+                 statementTTL: int = 3600,
                  **kwargs):
         '''
         Initialize the extended wrapper.
-        handle     : str. Your handle from Codeforces.
-        workingDir : str. Absolute path to working directory.
-                          If not provided, data will be saved
-                          and founded in directory with this file.
-        **kwargs   : Used for initialization of CodeforcesAPI.
+        handle       : str. Your handle from Codeforces.
+        workingDir   : str. Absolute path to working directory.
+                            If not provided, data will be saved
+                            and founded in directory with this file.
+        statementTTL : int. Number of seconds, during which saved
+                            contest statements are used instead of
+                            downloading them again. If None, saved
+                            statements never expire.
+        **kwargs     : Used for initialization of CodeforcesAPI.
         '''
         CodeforcesAPI.__init__(self, **kwargs)
         self._handle = handle
         self._workingDir = workingDir
+        self._statementTTL = statementTTL
 
-    @property
+    @cached_property
     def get_workingDir(self):
         '''
-        Returns current working directory.
+        Returns current working directory. It's computed
+        on first access only.
         '''
         if self._workingDir is None:
             return str(Path(__file__).parent.absolute())
         else:
             return self._workingDir
 
-    def _file_save(self, file: str, path: str, name: str):
+    def _file_save(self, file, path: str, name: str):
         '''
-        Saves file str as <name> in working directory.
-        If workingDir is not provided, data will be
-        saved in directory with this file.
+        Saves file bytes or str as <name> in <path> directory,
+        relative to working directory. If workingDir is
+        not provided, data will be saved in directory
+        with this file. Str is saved in UTF-8.
         '''
-        try:
-            makedirs(join_path(self.get_workingDir, path))
-        except FileExistsError:
-            pass
-        with open(join_path(self.get_workingDir, path, name), 'w') as stream:
-            stream.write(str(file))
+        if not isinstance(file, (bytes, bytearray)):
+            file = str(file).encode('utf-8')
+        makedirs(join_path(self.get_workingDir, path), exist_ok=True)
+        with open(join_path(self.get_workingDir, path, name), 'wb') as stream:
+            stream.write(file)
 
     def _hack_format(self, succ: int, unsucc: int):
         '''
@@ -862,11 +1179,41 @@ class ext_CodeforcesAPI(CodeforcesAPI):
         Create str with problem result.
         '''
         if problem.points != 0:
-            return '+{:<2} ({:02d}:{:02d})'.format(problem.rejectedAttemptCount or '',
-                                                   problem.bestSubmissionTimeSeconds // 3600,
-                                                   problem.bestSubmissionTimeSeconds % 3600 // 60)
-        elif problem.rejectedAttemptCount != 0:
-            return '-{:<2}'.format(problem.rejectedAttemptCount)
+            return self._result_format(problem.rejectedAttemptCount,
+                                       problem.bestSubmissionTimeSeconds)
+        return self._result_format(problem.rejectedAttemptCount, None)
+
+    @staticmethod
+    def _column_align(cells: list):
+        '''
+        Returns alignment of column with str cells: 'decimal', if all
+        not empty cells are numbers (like -1 or +2), else 'left'. The
+        same alignment was chosen by tabulate with number parsing.
+        '''
+        numeric = False
+        for cell in cells:
+            if cell:
+                try:
+                    float(cell)
+                except ValueError:
+                    return 'left'
+                numeric = True
+        return 'decimal' if numeric else 'left'
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _result_format(rejected: int, seconds: int):
+        '''
+        Create str with problem result by number of rejected
+        attempts and time of the best submission. Seconds is
+        None, if problem is not solved. Many cells in standings
+        are equal, so results are cached.
+        '''
+        if seconds is not None:
+            hours, seconds = divmod(seconds, 3600)
+            return f'+{rejected or "":<2} ({hours:02d}:{seconds // 60:02d})'
+        elif rejected != 0:
+            return f'-{rejected:<2}'
         else:
             return ''
 
@@ -880,6 +1227,8 @@ class ext_CodeforcesAPI(CodeforcesAPI):
         '''
         Return symbols for problems: A, B, C...
         '''
+        if num <= len(_PROBLEM_SYMBOLS):
+            return _PROBLEM_SYMBOLS[:num]
         return [chr(ord('A') + i) for i in range(num)]
 
     def get_verdicts(self, handle: str, from_sub: int = 1,
@@ -887,6 +1236,7 @@ class ext_CodeforcesAPI(CodeforcesAPI):
         '''
         Get the table of latest verdicts of user.
         '''
+        from tabulate import tabulate
         self.last_verdict = self.user_status(
             handle=handle,
             from_sub=from_sub,
@@ -895,25 +1245,23 @@ class ext_CodeforcesAPI(CodeforcesAPI):
 
         if len(self.last_verdict):
             if self.lang == 'en':
-                cols = ['#', 'When', 'Who', 'Problem',
-                        'Lang', 'Verdict', 'Time', 'Memory']
+                cols = _VERDICT_COLS_EN
             else:
-                cols = ['#', 'Когда', 'Кто', 'Задача',
-                        'Язык', 'Вердикт', 'Время', 'Память']
+                cols = _VERDICT_COLS_RU
             rows = []
             for tmp in self.last_verdict:
                 rows.append([tmp.id,
-                             datetime.fromtimestamp(
-                                 tmp.creationTimeSeconds
-                             ).strftime("%d.%m.%Y %H:%M"),
+                             strftime(_TIME_FORMAT,
+                                      localtime(tmp.creationTimeSeconds)),
                              handle,
                              tmp.problem.name,
                              tmp.programmingLanguage,
                              tmp.verdict,
                              tmp.timeConsumedMillis,
-                             int(tmp.memoryConsumedBytes / 1024 + 0.5)
+                             (tmp.memoryConsumedBytes + 512) // 1024
                             ])
-            return tabulate(rows, cols, tablefmt=mode)
+            return tabulate(rows, cols, tablefmt=mode,
+                            disable_numparse=True, colalign=_VERDICT_ALIGN)
         else:
             return ''
 
@@ -935,34 +1283,72 @@ class ext_CodeforcesAPI(CodeforcesAPI):
     def get_page(self, link: str, **params):
         '''
         Requests and returns HTML page by link with params:
-        http://codeforces.com/<link>
+        https://codeforces.com/<link>
         '''
         params['locale'] = self.lang
-        self.last_page = http_request(self._site_link + link, params=params)
+        self.last_page = self._session.get(self._site_link + link,
+                                           params=params,
+                                           timeout=self._timeout)
         self._check_request(self.last_page)
         return self.last_page.text
 
+    def _statement_dir(self, contestId: int):
+        '''
+        Returns directory with saved contest statements,
+        relative to working directory.
+        '''
+        return join_path('statements', str(contestId))
+
+    def _statement_file(self, contestId: int):
+        '''
+        Returns absolute path to saved contest statements.
+        '''
+        return join_path(self.get_workingDir,
+                         self._statement_dir(contestId),
+                         'webpage.html')
+
+    def _saved_statements(self, contestId: int):
+        '''
+        Returns path to saved contest statements, if they were
+        saved less than statementTTL seconds ago or statementTTL
+        is None. Otherwise, returns None.
+        '''
+        filename = self._statement_file(contestId)
+        if not Path(filename).is_file():
+            return None
+        if (self._statementTTL is None or
+                time() - getmtime(filename) < self._statementTTL):
+            return filename
+        return None
+
     def get_contestStatements(self, contestId: int):
         '''
         Get all problem statements from contest
-        by contestId in HTML format.
+        by contestId in HTML format. Saved statements
+        are used, if they are not older than statementTTL.
         '''
-        self.last_contestStatements = \
-            self.get_page('contest/{}/problems'.format(contestId))
+        filename = self._saved_statements(contestId)
+        if filename is not None:
+            with open(filename, 'rb') as stream:
+                self.last_contestStatements = stream.read().decode('utf-8')
+        else:
+            self.last_contestStatements = \
+                self.get_page('contest/{}/problems'.format(contestId))
         return self.last_contestStatements
 
     def save_contestStatements(self, contestId: int):
         '''
         Save the webpage with contest statements
-        in your working directory.
-        '''
-        self._file_save(self.get_contestStatements(contestId),
-                        join_path(
-                            self.get_workingDir,
-                            'statements', str(contestId)
-                        ),
-                        'webpage.html'
-        )
+        in your working directory. Does nothing, if
+        saved statements are not older than statementTTL.
+        '''
+        if self._saved_statements(contestId) is not None:
+            return
+        self.last_contestStatements = \
+            self.get_page('contest/{}/problems'.format(contestId))
+        self._file_save(self.last_page.content,
+                        self._statement_dir(contestId),
+                        'webpage.html')
 
     def open_contestStatements(self, contestId: int):
         '''
@@ -970,38 +1356,60 @@ class ext_CodeforcesAPI(CodeforcesAPI):
         statements are not saved, they will
         be downloaded.
         '''
-        filename = join_path(
-            self.get_workingDir,
-            'statements', str(contestId), 'webpage.html'
-        )
+        from webbrowser import open_new_tab
+        filename = self._statement_file(contestId)
         if not Path(filename).is_file():
             self.save_contestStatements(contestId)
         open_new_tab('file://' + filename)
 
     def contest_standingsTable(self, contestId: int, from_row: int = 1,
-                               count: int = 100, mode: str = 'fancy_grid'):
+                               count: int = 100, mode: str = 'fancy_grid',
+                               pages: list = None, workers: int = 4):
         '''
         Get the contest standings by contestId and return table
         by tabulate. You can choose mode for tabulate.
-        '''
-        request = self.contest_standings(contestId=contestId,
-                                         from_row=from_row,
-                                         count=count)[2]
-        rows, cols = list(), list()
+        If pages, list of (from_row, count) pairs, is provided,
+        they are requested simultaneously by workers threads
+        and shown in one table instead of from_row and count.
+        '''
+        from tabulate import tabulate
+        if pages is None:
+            request = self.contest_standings(contestId=contestId,
+                                             from_row=from_row,
+                                             count=count)[2]
+        else:
+            request = RanklistRow.from_list([
+                json
+                for result in self._request_standings_pages(contestId,
+                                                            pages, workers)
+                for json in result['rows']
+            ])
+        problems = len(request[0].problemResults)
         if self.lang == 'en':
             cols = ['#', 'Who', 'Hacks',
-                    *self._problem_symb(len(request[0].problemResults)),
+                    *self._problem_symb(problems),
                     'Penalty']
         else:
             cols = ['#', 'Кто', 'Взломы',
-                    *self._problem_symb(len(request[0].problemResults)),
+                    *self._problem_symb(problems),
                     'Пенальти']
-        for i in request:
-            rows.append([i.rank,
-                         self._party_format(i.party),
-                         self._hack_format(i.successfulHackCount,
-                                           i.unsuccessfulHackCount),
-                         *(self._problem_format(i.problemResults[j])
-                           for j in range(len(i.problemResults))),
-                         i.penalty])
-        return tabulate(rows, cols, tablefmt=mode)
+        party_format = self._party_format
+        hack_format = self._hack_format
+        problem_format = self._problem_format
+        rows = [None] * len(request)
+        for k, i in enumerate(request):
+            rows[k] = [i.rank,
+                       party_format(i.party),
+                       hack_format(i.successfulHackCount,
+                                   i.unsuccessfulHackCount),
+                       *[problem_format(p) for p in i.problemResults],
+                       i.penalty]
+        # Cells are never parsed as numbers, so numeric columns
+        # are aligned explicitly.
+        column_align = self._column_align
+        align = ('right', 'left',
+                 *[column_align([row[k] for row in rows])
+                   for k in range(2, problems + 3)],
+                 'right')
+        return tabulate(rows, cols, tablefmt=mode,
+                        disable_numparse=True, colalign=align)